@@ -23,6 +23,7 @@
 # Networks", CVPR'19 (https://arxiv.org/abs/1904.08755) if you use any part
 # of the code.
 from collections.abc import Sequence
+from functools import lru_cache
 import numpy as np
 from typing import Union
 
@@ -36,9 +37,25 @@ import MinkowskiEngineBackend._C as MEB
 StrideType = Union[int, Sequence, np.ndarray, torch.IntTensor]
 
 
+@lru_cache(maxsize=128)
+def _convert_to_int_tuple(arg: Union[int, tuple], dimension: int):
+    if isinstance(arg, tuple):
+        assert len(arg) == dimension
+        return arg
+    return (arg,) * dimension
+
+
 def convert_to_int_list(
     arg: Union[int, Sequence, np.ndarray, torch.Tensor], dimension: int
 ):
+    # Strides and kernel sizes are mostly python ints or tuples that are
+    # converted repeatedly. Cache them and return a new list every call. Only
+    # tuples of ints are cached since (2, 2) and (2.0, 2.0) share a cache key.
+    if type(arg) is int or (
+        type(arg) is tuple and all(type(a) is int for a in arg)
+    ):
+        return list(_convert_to_int_tuple(arg, dimension))
+
     if isinstance(arg, list):
         assert len(arg) == dimension
         return arg
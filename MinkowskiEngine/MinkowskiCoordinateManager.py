@@ -39,16 +39,31 @@ from MinkowskiEngineBackend._C import (
     RegionType,
 )
 
-CPU_COUNT = os.cpu_count()
-if "OMP_NUM_THREADS" in os.environ:
-    CPU_COUNT = int(os.environ["OMP_NUM_THREADS"])
-
 _allocator_type = GPUMemoryAllocatorType.PYTORCH
 _coordinate_map_type = (
     CoordinateMapType.CUDA if _C.is_cuda_available() else CoordinateMapType.CPU
 )
 _minkowski_algorithm = MinkowskiAlgorithm.DEFAULT
 
+# Backend manager classes by (coordinate map type, GPU allocator type)
+_MANAGER_CLASSES = {(CoordinateMapType.CPU, None): _C.CoordinateMapManagerCPU}
+try:
+    _MANAGER_CLASSES[
+        (CoordinateMapType.CUDA, GPUMemoryAllocatorType.CUDA)
+    ] = _C.CoordinateMapManagerGPU_default
+    _MANAGER_CLASSES[
+        (CoordinateMapType.CUDA, GPUMemoryAllocatorType.PYTORCH)
+    ] = _C.CoordinateMapManagerGPU_c10
+except AttributeError:
+    # CPU_ONLY build
+    pass
+
+
+def _get_cpu_count() -> int:
+    if "OMP_NUM_THREADS" in os.environ:
+        return int(os.environ["OMP_NUM_THREADS"])
+    return os.cpu_count()
+
 
 def set_coordinate_map_type(coordinate_map_type: CoordinateMapType):
     r"""Set the default coordinate map type.
@@ -105,6 +120,12 @@ class CoordsManager:
 
 
 class CoordinateManager:
+    def __new__(cls, D: int = 0, *args, **kwargs):
+        # Managers of the common ranks use the subclasses specialized for D
+        if cls is CoordinateManager:
+            cls = _SPECIALIZED_MANAGERS.get(D, cls)
+        return super().__new__(cls)
+
     def __init__(
         self,
         D: int = 0,
@@ -121,7 +142,7 @@ class CoordinateManager:
         if D < 1:
             raise ValueError(f"Invalid rank D > 0, D = {D}.")
         if num_threads < 0:
-            num_threads = min(CPU_COUNT, 20)
+            num_threads = min(_get_cpu_count(), 20)
         if coordinate_map_type is None:
             coordinate_map_type = _coordinate_map_type
         if allocator_type is None:
@@ -129,22 +150,27 @@ class CoordinateManager:
         if minkowski_algorithm is None:
             minkowski_algorithm = _minkowski_algorithm
 
-        postfix = ""
         if coordinate_map_type == CoordinateMapType.CPU:
-            postfix = "CPU"
+            allocator_type = None
         else:
             assert (
                 _C.is_cuda_available()
             ), "The MinkowskiEngine was compiled with CPU_ONLY flag. If you want to compile with CUDA support, make sure `torch.cuda.is_available()` is True when you install MinkowskiEngine."
-
-            postfix = "GPU" + (
-                "_default" if allocator_type == GPUMemoryAllocatorType.CUDA else "_c10"
-            )
+            if allocator_type != GPUMemoryAllocatorType.CUDA:
+                allocator_type = GPUMemoryAllocatorType.PYTORCH
 
         self.D = D
+        self.coordinate_map_type = coordinate_map_type
         self.minkowski_algorithm = minkowski_algorithm
-        self._CoordinateManagerClass = getattr(_C, "CoordinateMapManager" + postfix)
+        self._CoordinateManagerClass = _MANAGER_CLASSES[
+            (coordinate_map_type, allocator_type)
+        ]
         self._manager = self._CoordinateManagerClass(minkowski_algorithm, num_threads)
+        # Coordinate maps are never removed from a manager, so the strided keys
+        # can be reused until the manager is discarded. Kernel maps are cached
+        # by the backend.
+        self._stride_cache = {}
+        self._pinned_cache = {}
 
     # TODO: insert without remap, unique_map, inverse_mapa
     #
@@ -165,6 +191,10 @@ class CoordinateManager:
         :attr:`tensor_stride` (`list`): a list of `D` elements that defines the
         tensor stride for the new order-`D + 1` sparse tensor.
 
+        The returned `unique_map` and `inverse_map` are views of a single
+        allocation, so either map keeps the memory of both alive. Clone
+        `unique_map` if it outlives `inverse_map`.
+
         Example::
 
            >>> manager = CoordinateManager(D=1)
@@ -175,9 +205,92 @@ class CoordinateManager:
            >>> torch.all(coordinates == coordinates[unique_map][inverse_map]) # True
 
         """
-        tensor_stride = convert_to_int_list(tensor_stride, self.D)
+        tensor_stride = self._convert_to_int_list(tensor_stride)
+        if (
+            self.coordinate_map_type == CoordinateMapType.CUDA
+            and not coordinates.is_cuda
+        ):
+            coordinates = self._to_cuda(coordinates)
         return self._manager.insert_and_map(coordinates, tensor_stride, string_id)
 
+    def _to_cuda(self, coordinates: torch.Tensor) -> torch.Tensor:
+        r"""Copy CPU coordinates to the current CUDA device.
+
+        The coordinates are staged in a pinned buffer that is reused across
+        calls and grows to the largest input. This skips the pageable staging
+        copy and the page locking of every insert. The insertion still waits
+        for the copy, so the transfer time itself is not hidden.
+        """
+        if coordinates.is_pinned():
+            cuda_coordinates = coordinates.to("cuda", non_blocking=True)
+        else:
+            numel = coordinates.numel()
+            buffer, event = self._pinned_cache.get(coordinates.dtype, (None, None))
+            if buffer is None or buffer.numel() < numel:
+                buffer = torch.empty(numel, dtype=coordinates.dtype, pin_memory=True)
+                event = torch.cuda.Event()
+            else:
+                # The previous copy from the buffer must finish before refilling it
+                event.synchronize()
+            staging = buffer[:numel].view(coordinates.shape)
+            staging.copy_(coordinates)
+            cuda_coordinates = staging.to("cuda", non_blocking=True)
+            event.record()
+            self._pinned_cache[coordinates.dtype] = (buffer, event)
+
+        # The copy runs on the current stream and the backend inserts on the
+        # default stream
+        torch.cuda.default_stream().wait_stream(torch.cuda.current_stream())
+        return cuda_coordinates
+
+    def insert_multilevel(
+        self,
+        coordinates: torch.Tensor,
+        tensor_strides: Sequence,
+        string_id: str = "",
+    ) -> Tuple[List[CoordinateMapKey], Tuple[torch.IntTensor, torch.IntTensor]]:
+        r"""create the coordinate maps of a multi-resolution pyramid and returns
+        (keys, (map, inverse_map)).
+
+        :attr:`coordinates`: `torch.Tensor` of the finest level. Same as
+        :attr:`insert_and_map`.
+
+        :attr:`tensor_strides` (`list`): increasing tensor strides of the
+        levels, e.g. `[1, 2, 4, 8]`. Each tensor stride must be a multiple of
+        the previous one.
+
+        The input coordinates are hashed once for the first level. Each
+        following level is strided from the previous level, which has fewer
+        coordinates than the input. The strided maps are cached, so the
+        strided convolutions of a network reuse the maps.
+
+        Example::
+
+           >>> manager = CoordinateManager(D=3)
+           >>> keys, (unique_map, inverse_map) = manager.insert_multilevel(
+           >>>     coordinates, [1, 2, 4, 8])
+           >>> manager.size(keys[-1]) # number of coordinates with tensor stride 8
+
+        """
+        if len(tensor_strides) == 0:
+            raise ValueError("tensor_strides must have at least one level.")
+        tensor_strides = [self._convert_to_int_list(s) for s in tensor_strides]
+        level_strides = []
+        for prev_stride, curr_stride in zip(tensor_strides[:-1], tensor_strides[1:]):
+            if any(c % p != 0 for p, c in zip(prev_stride, curr_stride)):
+                raise ValueError(
+                    f"Tensor stride {curr_stride} is not a multiple of {prev_stride}."
+                )
+            level_strides.append([c // p for p, c in zip(prev_stride, curr_stride)])
+
+        key, unique_inverse_map = self.insert_and_map(
+            coordinates, tensor_strides[0], string_id
+        )
+        keys = [key]
+        for stride in level_strides:
+            keys.append(self.stride(keys[-1], stride, string_id))
+        return keys, unique_inverse_map
+
     def insert_field(
         self,
         coordinates: torch.Tensor,
@@ -264,8 +377,13 @@ class CoordinateManager:
 
         :attr:`stride`: stride size.
         """
-        stride = convert_to_int_list(stride, self.D)
-        return self._manager.stride(coordinate_map_key, stride, string_id)
+        stride = self._convert_to_int_list(stride)
+        cache_key = (coordinate_map_key, tuple(int(s) for s in stride), string_id)
+        if cache_key not in self._stride_cache:
+            self._stride_cache[cache_key] = self._manager.stride(
+                coordinate_map_key, stride, string_id
+            )
+        return self._stride_cache[cache_key]
 
     def origin(self) -> CoordinateMapKey:
         return self._manager.origin()
@@ -311,20 +429,38 @@ class CoordinateManager:
 
     def _get_coordinate_map_key(self, key_or_tensor_strides) -> CoordinateMapKey:
         r"""Helper function that retrieves the first coordinate map key for the given tensor stride."""
-        assert isinstance(key_or_tensor_strides, CoordinateMapKey) or isinstance(
-            key_or_tensor_strides, (Sequence, np.ndarray, torch.IntTensor, int)
-        ), f"The input must be either a CoordinateMapKey or tensor_stride of type (int, list, tuple, array, Tensor). Invalid: {key_or_tensor_strides}"
-        if isinstance(key_or_tensor_strides, CoordinateMapKey):
-            # Do nothing and return the input
-            return key_or_tensor_strides
-        else:
-            tensor_strides = convert_to_int_list(key_or_tensor_strides, self.D)
-            keys = self._manager.get_coordinate_map_keys(tensor_strides)
-            assert len(keys) > 0
-            return keys[0]
-
-    def get_coordinates(self, coords_key_or_tensor_strides) -> torch.Tensor:
+        get_key = _GET_COORDINATE_MAP_KEY.get(type(key_or_tensor_strides))
+        if get_key is None:
+            # Tensors, subclasses and numpy scalars
+            assert isinstance(key_or_tensor_strides, CoordinateMapKey) or isinstance(
+                key_or_tensor_strides, (Sequence, np.ndarray, torch.IntTensor, int)
+            ), f"The input must be either a CoordinateMapKey or tensor_stride of type (int, list, tuple, array, Tensor). Invalid: {key_or_tensor_strides}"
+            if isinstance(key_or_tensor_strides, CoordinateMapKey):
+                return key_or_tensor_strides
+            get_key = CoordinateManager._coordinate_map_key_from_tensor_strides
+        return get_key(self, key_or_tensor_strides)
+
+    def _convert_to_int_list(self, arg) -> list:
+        return convert_to_int_list(arg, self.D)
+
+    def _coordinate_map_key_from_tensor_strides(self, tensor_strides):
+        tensor_strides = self._convert_to_int_list(tensor_strides)
+        keys = self._manager.get_coordinate_map_keys(tensor_strides)
+        assert len(keys) > 0
+        return keys[0]
+
+    def get_coordinates(
+        self, coords_key_or_tensor_strides, out: torch.Tensor = None
+    ) -> torch.Tensor:
+        r"""Returns the coordinates of the coordinate map.
+
+        :attr:`out` (`torch.IntTensor`, optional): a contiguous tensor of the
+        same size and device as the coordinates to copy the coordinates to.
+        A new tensor is returned when not provided.
+        """
         key = self._get_coordinate_map_key(coords_key_or_tensor_strides)
+        if out is not None:
+            return self._manager.get_coordinates(key, out)
         return self._manager.get_coordinates(key)
 
     def get_coordinate_field(self, coords_key_or_tensor_strides) -> torch.Tensor:
@@ -409,9 +545,9 @@ class CoordinateManager:
         kernel_map = self._manager.kernel_map(
             in_key,
             out_key,
-            convert_to_int_list(kernel_size, self.D),  #
-            convert_to_int_list(stride, self.D),  #
-            convert_to_int_list(dilation, self.D),  #
+            self._convert_to_int_list(kernel_size),  #
+            self._convert_to_int_list(stride),  #
+            self._convert_to_int_list(dilation),  #
             region_type,
             region_offset,
             is_transpose,
@@ -420,6 +556,12 @@ class CoordinateManager:
 
         return kernel_map
 
+    def clear_cache(self):
+        r"""Clear the cached strided coordinate map keys and the pinned staging
+        buffers."""
+        self._stride_cache.clear()
+        self._pinned_cache.clear()
+
     def origin_map(self, key: CoordinateMapKey):
         return self._manager.origin_map(key)
 
@@ -468,26 +610,38 @@ class CoordinateManager:
     #         [key.CPPCoordsKey for key in in_keys], out_key.CPPCoordsKey
     #     )
 
-    # def permute_label(
-    #     self, label, max_label, target_tensor_stride, label_tensor_stride=1
-    # ):
-    #     if target_tensor_stride == label_tensor_stride:
-    #         return label
+    def permute_label(
+        self,
+        label: torch.Tensor,
+        max_label: int,
+        target_tensor_stride: Union[int, Sequence, np.ndarray, torch.Tensor],
+        label_tensor_stride: Union[int, Sequence, np.ndarray, torch.Tensor] = 1,
+    ) -> torch.Tensor:
+        r"""Returns the most frequent label of each coordinate of the target
+        tensor stride after voting with the labels of :attr:`label_tensor_stride`.
+
+        :attr:`label` (`torch.Tensor`): labels in the range `[0, max_label)`
+        for each coordinate of :attr:`label_tensor_stride`.
+        """
+        if target_tensor_stride == label_tensor_stride:
+            return label
 
-    #     label_coords_key = self._get_coordinate_map_key(label_tensor_stride)
-    #     target_coords_key = self._get_coordinate_map_key(target_tensor_stride)
+        label_key = self._get_coordinate_map_key(label_tensor_stride)
+        target_key = self._get_coordinate_map_key(target_tensor_stride)
 
-    #     permutation = self.get_mapping_by_coords_key(
-    #         label_coords_key, target_coords_key
-    #     )
-    #     nrows = self.get_coords_size_by_coords_key(target_coords_key)
+        in_map, out_map = self.stride_map(label_key, target_key)
+        nrows = self.size(target_key)
 
-    #     label = label.contiguous().numpy()
-    #     permutation = permutation.numpy()
+        label = label.to(in_map.device).long()
+        # An out of range label would vote for a neighboring target row
+        if len(label) > 0 and (label.min() < 0 or label.max() >= max_label):
+            raise ValueError(f"label must be in the range [0, {max_label}).")
 
-    #     counter = np.zeros((nrows, max_label), dtype="int32")
-    #     np.add.at(counter, (permutation, label), 1)
-    #     return torch.from_numpy(np.argmax(counter, 1))
+        # Histogram of (target row, label) pairs with a single bincount
+        counter = torch.bincount(
+            out_map * max_label + label[in_map], minlength=nrows * max_label
+        )
+        return counter.view(nrows, max_label).argmax(1)
 
     def __repr__(self):
         return (
@@ -496,3 +650,37 @@ class CoordinateManager:
             + str(self._manager)
             + f"\talgorithm={self.minkowski_algorithm}\n  )\n"
         )
+
+
+def _specialized_coordinate_manager(D: int) -> type:
+    r"""Returns a CoordinateManager subclass for the rank :attr:`D` that
+    expands strides and kernel sizes without the generic conversion."""
+
+    def _convert_to_int_list(self, arg) -> list:
+        if type(arg) is int:
+            return [arg] * D
+        if type(arg) is list and len(arg) == D:
+            return arg
+        return convert_to_int_list(arg, D)
+
+    return type(
+        f"_CoordinateManager{D}",
+        (CoordinateManager,),
+        {
+            "__doc__": f"CoordinateManager specialized for D={D}.",
+            "_convert_to_int_list": _convert_to_int_list,
+        },
+    )
+
+
+_SPECIALIZED_MANAGERS = {D: _specialized_coordinate_manager(D) for D in (3, 4)}
+
+# Dispatch on the exact input type of `CoordinateManager._get_coordinate_map_key`.
+# Tensors are left to the isinstance check, which only accepts CPU int tensors.
+_GET_COORDINATE_MAP_KEY = {
+    CoordinateMapKey: lambda manager, key: key,
+    **{
+        t: CoordinateManager._coordinate_map_key_from_tensor_strides
+        for t in (int, list, tuple, np.ndarray)
+    },
+}
@@ -133,6 +133,8 @@ def clear_global_coordinate_manager():
     you must explicitly clear the coordinate manager after each feed forward/backward.
     """
     global _global_coordinate_manager
+    if _global_coordinate_manager is not None:
+        _global_coordinate_manager.clear_cache()
     _global_coordinate_manager = None
 
 
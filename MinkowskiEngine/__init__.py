@@ -26,6 +26,7 @@ __version__ = "0.5.4"
 
 import os
 import sys
+import importlib
 import warnings
 
 file_dir = os.path.dirname(__file__)
@@ -97,118 +98,139 @@ from MinkowskiCoordinateManager import (
     CoordinateManager,
 )
 
-from MinkowskiConvolution import (
-    MinkowskiConvolutionFunction,
-    MinkowskiConvolution,
-    MinkowskiConvolutionTransposeFunction,
-    MinkowskiConvolutionTranspose,
-    MinkowskiGenerativeConvolutionTranspose,
-)
-
-
-from MinkowskiChannelwiseConvolution import MinkowskiChannelwiseConvolution
-
-from MinkowskiPooling import (
-    MinkowskiLocalPoolingFunction,
-    MinkowskiSumPooling,
-    MinkowskiAvgPooling,
-    MinkowskiMaxPooling,
-    MinkowskiLocalPoolingTransposeFunction,
-    MinkowskiPoolingTranspose,
-    MinkowskiGlobalPoolingFunction,
-    MinkowskiGlobalPooling,
-    MinkowskiGlobalSumPooling,
-    MinkowskiGlobalAvgPooling,
-    MinkowskiGlobalMaxPooling,
-    MinkowskiDirectMaxPoolingFunction,
-)
-
-from MinkowskiBroadcast import (
-    MinkowskiBroadcastFunction,
-    MinkowskiBroadcastAddition,
-    MinkowskiBroadcastMultiplication,
-    MinkowskiBroadcast,
-    MinkowskiBroadcastConcatenation,
-)
-
-from MinkowskiNonlinearity import (
-    MinkowskiELU,
-    MinkowskiHardshrink,
-    MinkowskiHardsigmoid,
-    MinkowskiHardtanh,
-    MinkowskiHardswish,
-    MinkowskiLeakyReLU,
-    MinkowskiLogSigmoid,
-    MinkowskiPReLU,
-    MinkowskiReLU,
-    MinkowskiReLU6,
-    MinkowskiRReLU,
-    MinkowskiSELU,
-    MinkowskiCELU,
-    MinkowskiGELU,
-    MinkowskiSigmoid,
-    MinkowskiSiLU,
-    MinkowskiSoftplus,
-    MinkowskiSoftshrink,
-    MinkowskiSoftsign,
-    MinkowskiTanh,
-    MinkowskiTanhshrink,
-    MinkowskiThreshold,
-    MinkowskiSoftmin,
-    MinkowskiSoftmax,
-    MinkowskiLogSoftmax,
-    MinkowskiAdaptiveLogSoftmaxWithLoss,
-    MinkowskiDropout,
-    MinkowskiAlphaDropout,
-    MinkowskiSinusoidal,
-)
-
-from MinkowskiNormalization import (
-    MinkowskiBatchNorm,
-    MinkowskiSyncBatchNorm,
-    MinkowskiInstanceNorm,
-    MinkowskiInstanceNormFunction,
-    MinkowskiStableInstanceNorm,
-)
-
+# Layers, functionals and utilities are imported on first access (PEP 562)
+# so that `import MinkowskiEngine` only loads the sparse tensor core.
+_LAZY_MODULES = {
+    "MinkowskiConvolution": (
+        "MinkowskiConvolutionFunction",
+        "MinkowskiConvolution",
+        "MinkowskiConvolutionTransposeFunction",
+        "MinkowskiConvolutionTranspose",
+        "MinkowskiGenerativeConvolutionTranspose",
+    ),
+    "MinkowskiChannelwiseConvolution": (
+        "MinkowskiChannelwiseConvolution",
+    ),
+    "MinkowskiPooling": (
+        "MinkowskiLocalPoolingFunction",
+        "MinkowskiSumPooling",
+        "MinkowskiAvgPooling",
+        "MinkowskiMaxPooling",
+        "MinkowskiLocalPoolingTransposeFunction",
+        "MinkowskiPoolingTranspose",
+        "MinkowskiGlobalPoolingFunction",
+        "MinkowskiGlobalPooling",
+        "MinkowskiGlobalSumPooling",
+        "MinkowskiGlobalAvgPooling",
+        "MinkowskiGlobalMaxPooling",
+        "MinkowskiDirectMaxPoolingFunction",
+    ),
+    "MinkowskiBroadcast": (
+        "MinkowskiBroadcastFunction",
+        "MinkowskiBroadcastAddition",
+        "MinkowskiBroadcastMultiplication",
+        "MinkowskiBroadcast",
+        "MinkowskiBroadcastConcatenation",
+    ),
+    "MinkowskiNonlinearity": (
+        "MinkowskiELU",
+        "MinkowskiHardshrink",
+        "MinkowskiHardsigmoid",
+        "MinkowskiHardtanh",
+        "MinkowskiHardswish",
+        "MinkowskiLeakyReLU",
+        "MinkowskiLogSigmoid",
+        "MinkowskiPReLU",
+        "MinkowskiReLU",
+        "MinkowskiReLU6",
+        "MinkowskiRReLU",
+        "MinkowskiSELU",
+        "MinkowskiCELU",
+        "MinkowskiGELU",
+        "MinkowskiSigmoid",
+        "MinkowskiSiLU",
+        "MinkowskiSoftplus",
+        "MinkowskiSoftshrink",
+        "MinkowskiSoftsign",
+        "MinkowskiTanh",
+        "MinkowskiTanhshrink",
+        "MinkowskiThreshold",
+        "MinkowskiSoftmin",
+        "MinkowskiSoftmax",
+        "MinkowskiLogSoftmax",
+        "MinkowskiAdaptiveLogSoftmaxWithLoss",
+        "MinkowskiDropout",
+        "MinkowskiAlphaDropout",
+        "MinkowskiSinusoidal",
+    ),
+    "MinkowskiNormalization": (
+        "MinkowskiBatchNorm",
+        "MinkowskiSyncBatchNorm",
+        "MinkowskiInstanceNorm",
+        "MinkowskiInstanceNormFunction",
+        "MinkowskiStableInstanceNorm",
+    ),
+    "MinkowskiPruning": (
+        "MinkowskiPruning",
+        "MinkowskiPruningFunction",
+    ),
+    "MinkowskiUnion": (
+        "MinkowskiUnion",
+        "MinkowskiUnionFunction",
+    ),
+    "MinkowskiInterpolation": (
+        "MinkowskiInterpolation",
+        "MinkowskiInterpolationFunction",
+    ),
+    "MinkowskiNetwork": (
+        "MinkowskiNetwork",
+    ),
+    "MinkowskiOps": (
+        "MinkowskiLinear",
+        "MinkowskiToSparseTensor",
+        "MinkowskiToDenseTensor",
+        "MinkowskiToFeature",
+        "MinkowskiStackCat",
+        "MinkowskiStackSum",
+        "MinkowskiStackMean",
+        "MinkowskiStackVar",
+        "cat",
+        "mean",
+        "var",
+        "to_sparse",
+        "to_sparse_all",
+        "dense_coordinates",
+    ),
+}
+
+_LAZY_ATTRIBUTES = {
+    name: (module, name) for module, names in _LAZY_MODULES.items() for name in names
+}
+_LAZY_ATTRIBUTES["sum"] = ("MinkowskiOps", "_sum")
+
+_LAZY_SUBMODULES = {
+    "MinkowskiOps": "MinkowskiOps",
+    "MinkowskiFunctional": "MinkowskiFunctional",
+    "utils": "MinkowskiEngine.utils",
+    "modules": "MinkowskiEngine.modules",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        value = importlib.import_module(_LAZY_SUBMODULES[name])
+    elif name in _LAZY_ATTRIBUTES:
+        module, attribute = _LAZY_ATTRIBUTES[name]
+        value = getattr(importlib.import_module(module), attribute)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_LAZY_SUBMODULES))
 
-from MinkowskiPruning import MinkowskiPruning, MinkowskiPruningFunction
-
-from MinkowskiUnion import MinkowskiUnion, MinkowskiUnionFunction
-
-from MinkowskiInterpolation import (
-    MinkowskiInterpolation,
-    MinkowskiInterpolationFunction,
-)
-
-from MinkowskiNetwork import MinkowskiNetwork
-
-import MinkowskiOps
-
-from MinkowskiOps import (
-    MinkowskiLinear,
-    MinkowskiToSparseTensor,
-    MinkowskiToDenseTensor,
-    MinkowskiToFeature,
-    MinkowskiStackCat,
-    MinkowskiStackSum,
-    MinkowskiStackMean,
-    MinkowskiStackVar,
-    cat,
-    mean,
-    var,
-    to_sparse,
-    to_sparse_all,
-    dense_coordinates,
-)
-
-from MinkowskiOps import _sum as sum
-
-import MinkowskiFunctional
-
-import MinkowskiEngine.utils as utils
-
-import MinkowskiEngine.modules as modules
 
 from sparse_matrix_functions import (
     spmm,
@@ -216,6 +238,15 @@ from sparse_matrix_functions import (
     MinkowskiSPMMAverageFunction,
 )
 
+# `from MinkowskiEngine import *` exports the lazy names as well. importlib is
+# only used by __getattr__.
+__all__ = sorted(
+    {name for name in globals() if not name.startswith("_")}
+    - {"importlib"}
+    | set(_LAZY_ATTRIBUTES)
+    | set(_LAZY_SUBMODULES)
+)
+
 
 if not is_cuda_available():
     warnings.warn(
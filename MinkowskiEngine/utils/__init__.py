@@ -22,7 +22,7 @@
 # Networks", CVPR'19 (https://arxiv.org/abs/1904.08755) if you use any part
 # of the code.
 from .quantization import sparse_quantize, ravel_hash_vec, fnv_hash_vec, unique_coordinate_map
-from .collation import SparseCollation, batched_coordinates, sparse_collate, batch_sparse_collate
+from .collation import SparseCollation, batched_coordinates, batched_coordinates_numba, sparse_collate, batch_sparse_collate
 # from .coords import get_coords_map
 from .init import kaiming_normal_
 from .summary import summary
\ No newline at end of file
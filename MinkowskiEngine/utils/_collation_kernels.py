@@ -0,0 +1,47 @@
+# Copyright (c) Chris Choy (chrischoy@ai.stanford.edu).
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# Please cite "4D Spatio-Temporal ConvNets: Minkowski Convolutional Neural
+# Networks", CVPR'19 (https://arxiv.org/abs/1904.08755) if you use any part
+# of the code.
+# numba kernels of `batched_coordinates_numba`. The module is imported lazily
+# so that numba stays optional, and the kernels are defined at the module level
+# so that numba can cache the compiled kernels on disk.
+import numba
+
+
+@numba.njit(parallel=True, cache=True)
+def fill(offsets, coords, bcoords):
+    for b in numba.prange(len(coords)):
+        cs = coords[b]
+        for i in range(cs.shape[0]):
+            bcoords[offsets[b] + i, 0] = b
+            for d in range(cs.shape[1]):
+                bcoords[offsets[b] + i, d + 1] = cs[i, d]
+
+
+@numba.njit(parallel=True, cache=True)
+def fill_repeated(cs, batch_size, bcoords):
+    N = cs.shape[0]
+    for j in numba.prange(batch_size * N):
+        b = j // N
+        bcoords[j, 0] = b
+        for d in range(cs.shape[1]):
+            bcoords[j, d + 1] = cs[j - b * N, d]
@@ -93,6 +93,80 @@ def batched_coordinates(coords, dtype=torch.int32, device=None):
     return bcoords
 
 
+_batched_coordinates_kernels = None
+
+
+def _get_batched_coordinates_kernels():
+    global _batched_coordinates_kernels
+    if _batched_coordinates_kernels is not None:
+        return _batched_coordinates_kernels
+
+    try:
+        from numba.typed import List
+    except ImportError:
+        raise ImportError("Please install numba with `pip install numba`.")
+    from ._collation_kernels import fill, fill_repeated
+
+    _batched_coordinates_kernels = (fill, fill_repeated, List)
+    return _batched_coordinates_kernels
+
+
+def batched_coordinates_numba(coords, dtype=torch.int32, device=None):
+    r"""Create a `ME.SparseTensor` coordinates from a sequence of coordinates
+    with a parallel numba kernel.
+
+    Same as :attr:`MinkowskiEngine.utils.batched_coordinates`, but a single
+    jit-compiled kernel fills all batches in parallel. When all coordinates are
+    the same object, it is converted once and repeated for every batch.
+    Requires `numba`.
+
+    Args:
+        :attr:`coords` (a sequence of `torch.Tensor` or `numpy.ndarray`): a
+        list of coordinates.
+
+        :attr:`dtype`: torch data type of the return tensor. torch.int32 by default.
+
+    Returns:
+        :attr:`batched_coordindates` (`torch.Tensor`): a batched coordinates.
+
+    """
+    assert isinstance(
+        coords, collections.abc.Sequence
+    ), "The coordinates must be a sequence."
+    assert np.array(
+        [cs.ndim == 2 for cs in coords]
+    ).all(), "All coordinates must be in a 2D array."
+    D = np.unique(np.array([cs.shape[1] for cs in coords]))
+    assert len(D) == 1, f"Dimension of the array mismatch. All dimensions: {D}"
+    D = D[0]
+    assert dtype in [
+        torch.int32,
+        torch.float32,
+    ], "Only torch.int32, torch.float32 supported for coordinates."
+    np_dtype = np.int32 if dtype == torch.int32 else np.float32
+
+    def to_numpy(cs):
+        if isinstance(cs, torch.Tensor):
+            cs = cs.cpu().numpy()
+        if dtype == torch.int32 and not np.issubdtype(cs.dtype, np.integer):
+            cs = np.floor(cs)
+        return np.ascontiguousarray(cs, dtype=np_dtype)
+
+    fill, fill_repeated, typed_list = _get_batched_coordinates_kernels()
+    lengths = np.array([len(cs) for cs in coords], dtype=np.int64)
+    bcoords = np.empty((lengths.sum(), D + 1), dtype=np_dtype)
+    if all(cs is coords[0] for cs in coords):
+        fill_repeated(to_numpy(coords[0]), len(coords), bcoords)
+    else:
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        fill(offsets, typed_list([to_numpy(cs) for cs in coords]), bcoords)
+
+    bcoords = torch.from_numpy(bcoords)
+    if device is not None:
+        bcoords = bcoords.to(device)
+    return bcoords
+
+
 def sparse_collate(coords, feats, labels=None, dtype=torch.int32, device=None):
     r"""Create input arguments for a sparse tensor `the documentation
     <https://nvidia.github.io/MinkowskiEngine/sparse_tensor.html>`_.
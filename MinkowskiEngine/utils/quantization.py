@@ -313,17 +313,19 @@ def sparse_quantize(
         _, (unique_map, inverse_map) = manager.insert_and_map(
             discrete_coordinates, tensor_stride, ""
         )
+        # unique_map and inverse_map share one buffer. Copy unique_map when it
+        # is returned alone so that the inverse map can be freed.
         if return_maps_only:
             if return_inverse:
                 return unique_map, inverse_map
             else:
-                return unique_map
+                return unique_map.clone()
 
         return_args = [discrete_coordinates[unique_map]]
         if use_feat:
             return_args.append(features[unique_map])
         if return_index:
-            return_args.append(unique_map)
+            return_args.append(unique_map if return_inverse else unique_map.clone())
         if return_inverse:
             return_args.append(inverse_map)
 
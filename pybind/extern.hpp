@@ -789,7 +789,12 @@ void instantiate_manager(py::module &m, const std::string &dtypestr) {
       .def("stride", &manager_type::py_stride)
       .def("origin", &manager_type::py_origin)
       .def("origin_field", &manager_type::py_origin_field)
-      .def("get_coordinates", &manager_type::get_coordinates)
+      .def("get_coordinates",
+           py::overload_cast<minkowski::CoordinateMapKey const *>(
+               &manager_type::get_coordinates, py::const_))
+      .def("get_coordinates",
+           py::overload_cast<minkowski::CoordinateMapKey const *, at::Tensor &>(
+               &manager_type::get_coordinates, py::const_))
       .def("get_coordinate_field", &manager_type::get_coordinate_field)
       .def("get_coordinate_map_keys", &manager_type::get_coordinate_map_keys)
       .def("field_to_sparse_keys", &manager_type::field_to_sparse_keys)
@@ -28,17 +28,180 @@
 #include "math_functions.hpp"
 #include "types.hpp"
 
+#include <algorithm>
+#include <limits>
+#include <numeric>
+#include <omp.h>
+
 namespace minkowski {
 
+namespace detail {
+
+template <typename Dtype, int in_nchannel>
+inline void direct_convolution_accumulate(const Dtype *p_in_feat,
+                                          Dtype *p_out_feat, int out_nchannel,
+                                          const Dtype *p_curr_kernel) {
+  for (int c = 0; c < in_nchannel; c++) {
+    const Dtype value = p_in_feat[c];
+    const Dtype *weight = p_curr_kernel + c * out_nchannel;
+#pragma omp simd
+    for (int o = 0; o < out_nchannel; o++)
+      p_out_feat[o] += value * weight[o];
+  }
+}
+
+/*
+ * Runs the direct convolution over tiles of tile_size output rows. The pairs
+ * of a tile are stored as the input row and the offset of the output row in
+ * the tile, in the narrowest types that fit, which shrinks the index stream
+ * streamed by the tile loop.
+ */
+template <typename Dtype, int in_nchannel, typename in_index_type>
+void tiled_direct_convolution_forward(const Dtype *p_in_feat, Dtype *p_out_feat,
+                                      int out_nchannel, const Dtype *p_kernel,
+                                      const cpu_in_maps &in_maps,
+                                      const cpu_out_maps &out_maps,
+                                      default_types::index_type num_tiles) {
+  using index_type = default_types::index_type;
+  using tile_offset_type = uint8_t;
+  constexpr index_type tile_size = 64;
+  static_assert(tile_size <= std::numeric_limits<tile_offset_type>::max() + 1,
+                "tile offsets must fit in tile_offset_type");
+  int const kernel_volume = in_maps.size();
+
+  // Bucket the pairs of each kernel offset by output tiles. Segment
+  // k * num_tiles + tile holds the pairs of the kernel offset k in the tile.
+  std::vector<size_t> segment_begin(kernel_volume * num_tiles + 1, 0);
+#pragma omp parallel for
+  for (int k = 0; k < kernel_volume; k++)
+    for (auto const out_row : out_maps[k])
+      ++segment_begin[k * num_tiles + out_row / tile_size + 1];
+  std::partial_sum(segment_begin.begin(), segment_begin.end(),
+                   segment_begin.begin());
+
+  std::vector<in_index_type> tile_in_rows(segment_begin.back());
+  std::vector<tile_offset_type> tile_out_offsets(segment_begin.back());
+#pragma omp parallel for
+  for (int k = 0; k < kernel_volume; k++) {
+    std::vector<size_t> cursor(segment_begin.begin() + k * num_tiles,
+                               segment_begin.begin() + (k + 1) * num_tiles);
+    for (size_t row = 0; row < in_maps[k].size(); row++) {
+      auto const out_row = out_maps[k][row];
+      auto const i = cursor[out_row / tile_size]++;
+      tile_in_rows[i] = in_maps[k][row];
+      tile_out_offsets[i] = out_row % tile_size;
+    }
+  }
+
+#pragma omp parallel for schedule(dynamic, 16)
+  for (index_type tile = 0; tile < num_tiles; tile++) {
+    Dtype *p_tile_out_feat =
+        p_out_feat + size_t(tile) * tile_size * out_nchannel;
+    for (int k = 0; k < kernel_volume; k++) {
+      const Dtype *p_curr_kernel = &p_kernel[k * in_nchannel * out_nchannel];
+      for (size_t i = segment_begin[k * num_tiles + tile];
+           i < segment_begin[k * num_tiles + tile + 1]; i++)
+        direct_convolution_accumulate<Dtype, in_nchannel>(
+            p_in_feat + size_t(tile_in_rows[i]) * in_nchannel,
+            p_tile_out_feat + tile_out_offsets[i] * out_nchannel,
+            out_nchannel, p_curr_kernel);
+    }
+  }
+}
+
+/*
+ * Convolution for a few input channels, e.g. the first layer on colors or
+ * normals, where the im2col buffers and a gemm call per kernel offset cost more
+ * than the arithmetic. The input channel loop has a compile time trip count
+ * and the output channel loop is contiguous, so the compiler unrolls the
+ * former and vectorizes the latter with fused multiply-adds.
+ *
+ * The (in, out) pairs are bucketed by tiles of output rows, so each thread
+ * owns a tile without atomics and the output rows of a tile stay in L1 while
+ * all kernel offsets are applied.
+ */
+template <typename Dtype, int in_nchannel>
+void direct_convolution_forward(const Dtype *p_in_feat, Dtype *p_out_feat,
+                                int out_nchannel, const Dtype *p_kernel,
+                                const cpu_in_maps &in_maps,
+                                const cpu_out_maps &out_maps) {
+  using index_type = default_types::index_type;
+  constexpr index_type tile_size = 64;
+  int const kernel_volume = in_maps.size();
+
+  if (kernel_volume == 0)
+    return;
+
+  if (omp_get_max_threads() == 1) {
+    for (int k = 0; k < kernel_volume; k++) {
+      const Dtype *p_curr_kernel = &p_kernel[k * in_nchannel * out_nchannel];
+      for (size_t row = 0; row < in_maps[k].size(); row++)
+        direct_convolution_accumulate<Dtype, in_nchannel>(
+            p_in_feat + in_maps[k][row] * in_nchannel,
+            p_out_feat + out_maps[k][row] * out_nchannel, out_nchannel,
+            p_curr_kernel);
+    }
+    return;
+  }
+
+  // Number of output tiles and the largest input row
+  std::vector<index_type> max_out_rows(kernel_volume, 0),
+      max_in_rows(kernel_volume, 0);
+#pragma omp parallel for
+  for (int k = 0; k < kernel_volume; k++) {
+    for (auto const out_row : out_maps[k])
+      max_out_rows[k] = std::max(max_out_rows[k], out_row + 1);
+    for (auto const in_row : in_maps[k])
+      max_in_rows[k] = std::max(max_in_rows[k], in_row);
+  }
+  index_type const num_tiles =
+      (*std::max_element(max_out_rows.begin(), max_out_rows.end()) +
+       tile_size - 1) /
+      tile_size;
+  index_type const max_in_row =
+      *std::max_element(max_in_rows.begin(), max_in_rows.end());
+
+  if (max_in_row <= std::numeric_limits<uint16_t>::max())
+    tiled_direct_convolution_forward<Dtype, in_nchannel, uint16_t>(
+        p_in_feat, p_out_feat, out_nchannel, p_kernel, in_maps, out_maps,
+        num_tiles);
+  else
+    tiled_direct_convolution_forward<Dtype, in_nchannel, index_type>(
+        p_in_feat, p_out_feat, out_nchannel, p_kernel, in_maps, out_maps,
+        num_tiles);
+}
+
+} // end namespace detail
+
 template <typename Dtype, typename Itype>
 void ConvolutionForwardKernelCPU(const Dtype *p_in_feat, int in_nchannel,
                                  Dtype *p_out_feat, int out_nchannel,
                                  const Dtype *p_kernel,
                                  const cpu_in_maps &in_maps,
                                  const cpu_out_maps &out_maps) {
+  using index_type = default_types::index_type;
   int kernel_volume, n_active_in_volume, row;
   std::vector<Dtype> input_buffer, output_buffer;
 
+  switch (in_nchannel) {
+  case 1:
+    detail::direct_convolution_forward<Dtype, 1>(
+        p_in_feat, p_out_feat, out_nchannel, p_kernel, in_maps, out_maps);
+    return;
+  case 2:
+    detail::direct_convolution_forward<Dtype, 2>(
+        p_in_feat, p_out_feat, out_nchannel, p_kernel, in_maps, out_maps);
+    return;
+  case 3:
+    detail::direct_convolution_forward<Dtype, 3>(
+        p_in_feat, p_out_feat, out_nchannel, p_kernel, in_maps, out_maps);
+    return;
+  case 4:
+    detail::direct_convolution_forward<Dtype, 4>(
+        p_in_feat, p_out_feat, out_nchannel, p_kernel, in_maps, out_maps);
+    return;
+  }
+
   // Number of weights
   kernel_volume = in_maps.size();
 
@@ -52,10 +215,17 @@ void ConvolutionForwardKernelCPU(const Dtype *p_in_feat, int in_nchannel,
     input_buffer.resize(n_active_in_volume * in_nchannel);
     output_buffer.resize(n_active_in_volume * out_nchannel);
 
+    // The gather reads only the input indices and the scatter only the
+    // output indices. Both are unique within a kernel offset, so the rows are
+    // independent.
+    const index_type *in_rows = in_maps[k].data();
+    const index_type *out_rows = out_maps[k].data();
+
     // Gather all features (im2col)
+#pragma omp parallel for
     for (row = 0; row < n_active_in_volume; row++)
       std::memcpy(&input_buffer[row * in_nchannel],
-                  p_in_feat + in_maps[k][row] * in_nchannel,
+                  p_in_feat + in_rows[row] * in_nchannel,
                   sizeof(Dtype) * in_nchannel);
 
     // C := alpha*op(A)*op(B) + beta*C
@@ -70,8 +240,9 @@ void ConvolutionForwardKernelCPU(const Dtype *p_in_feat, int in_nchannel,
                     &output_buffer[0]);                        // C
 
     // Put it back to the correct index
+#pragma omp parallel for
     for (row = 0; row < n_active_in_volume; row++) {
-      Dtype *dst = &p_out_feat[out_maps[k][row] * out_nchannel];
+      Dtype *dst = &p_out_feat[out_rows[row] * out_nchannel];
       Dtype *src = &output_buffer[row * out_nchannel];
       cpu_add<Dtype>(out_nchannel, src, dst, dst);
     }
@@ -85,6 +256,7 @@ void ConvolutionBackwardKernelCPU(const Dtype *p_in_feat, Dtype *p_grad_in_feat,
                                   Dtype *p_grad_kernel,
                                   const cpu_in_maps &in_maps,
                                   const cpu_out_maps &out_maps) {
+  using index_type = default_types::index_type;
   int kernel_volume, n_active_in_volume, row;
   std::vector<Dtype> input_buffer, output_buffer;
 
@@ -100,10 +272,14 @@ void ConvolutionBackwardKernelCPU(const Dtype *p_in_feat, Dtype *p_grad_in_feat,
     input_buffer.resize(n_active_in_volume * in_nchannel);
     output_buffer.resize(n_active_in_volume * out_nchannel);
 
+    const index_type *in_rows = in_maps[k].data();
+    const index_type *out_rows = out_maps[k].data();
+
     // Gather all features for a matrix multiplication (im2col)
+#pragma omp parallel for
     for (row = 0; row < n_active_in_volume; row++)
       std::memcpy(&output_buffer[row * out_nchannel],
-                  &p_grad_out_feat[out_maps[k][row] * out_nchannel],
+                  &p_grad_out_feat[out_rows[row] * out_nchannel],
                   sizeof(Dtype) * out_nchannel);
 
     cpu_gemm<Dtype>(CblasColMajor, CblasTrans, CblasNoTrans,
@@ -118,16 +294,18 @@ void ConvolutionBackwardKernelCPU(const Dtype *p_in_feat, Dtype *p_grad_in_feat,
     );
 
     // Accumulate gradients back to the input grad feat
+#pragma omp parallel for
     for (row = 0; row < n_active_in_volume; row++) {
       Dtype *src = &input_buffer[row * in_nchannel];
-      Dtype *dst = &p_grad_in_feat[in_maps[k][row] * in_nchannel];
+      Dtype *dst = &p_grad_in_feat[in_rows[row] * in_nchannel];
       cpu_add<Dtype>(in_nchannel, src, dst, dst);
     }
 
     // Compute gradient for kernel
+#pragma omp parallel for
     for (row = 0; row < n_active_in_volume; row++)
       std::memcpy(&input_buffer[row * in_nchannel],
-                  p_in_feat + in_maps[k][row] * in_nchannel,
+                  p_in_feat + in_rows[row] * in_nchannel,
                   sizeof(Dtype) * in_nchannel);
 
     cpu_gemm<Dtype>(CblasColMajor, CblasNoTrans, CblasTrans,
@@ -290,7 +290,7 @@ public:
 
   using key_type       = coordinate<coordinate_type>;
   using mapped_type    = default_types::index_type;
-  using hasher         = detail::coordinate_murmur3<coordinate_type>;
+  using hasher         = detail::coordinate_packed_hash<coordinate_type>;
   using key_equal      = detail::coordinate_equal_to<coordinate_type>;
   using map_type       =
       robin_hood::unordered_flat_map<key_type,    // key
@@ -356,6 +356,9 @@ public:
                  coordinate_type const *coordinate_end) {
     size_type N = (coordinate_end - coordinate_begin) / m_coordinate_size;
 
+    if (remap && N >= parallel_insert_min_size && omp_get_max_threads() > 1)
+      return parallel_insert_and_map(coordinate_begin, N);
+
     std::vector<int64_t> mapping, inverse_mapping;
     base_type::allocate(N);
     mapping.reserve(N);
@@ -935,6 +938,82 @@ public:
   inline const_iterator cend() const { return m_map.cend(); }
 
 private:
+  /*
+   * @brief remapping insertion that deduplicates the coordinates in parallel.
+   *
+   * Rows are partitioned into buckets by their hash so that all duplicates of
+   * a coordinate fall in the same bucket. Each bucket is deduplicated with a
+   * thread-local map, then the unique rows are inserted serially in the order
+   * of their first occurrence. The maps are identical to the serial
+   * insert_and_map<true>.
+   */
+  std::pair<std::vector<int64_t>, std::vector<int64_t>> // return maps
+  parallel_insert_and_map(coordinate_type const *coordinate_begin,
+                          size_type const N) {
+    const size_type num_buckets = 2 * omp_get_max_threads();
+    hasher const hash{m_coordinate_size};
+
+    // Pass 1: bucket of each row.
+    std::vector<size_type> bucket(N);
+#pragma omp parallel for
+    for (index_type row = 0; row < N; ++row) {
+      bucket[row] =
+          hash(key_type(coordinate_begin + row * m_coordinate_size)) %
+          num_buckets;
+    }
+
+    // Sort rows by bucket, keeping the row order within a bucket.
+    std::vector<size_type> bucket_begin(num_buckets + 1, 0);
+    for (index_type row = 0; row < N; ++row)
+      ++bucket_begin[bucket[row] + 1];
+    std::partial_sum(bucket_begin.begin(), bucket_begin.end(),
+                     bucket_begin.begin());
+    std::vector<index_type> bucket_rows(N);
+    {
+      std::vector<size_type> offset(bucket_begin.begin(),
+                                    bucket_begin.end() - 1);
+      for (index_type row = 0; row < N; ++row)
+        bucket_rows[offset[bucket[row]]++] = row;
+    }
+
+    // Pass 2: first occurrence of each row within its bucket.
+    std::vector<index_type> first_row(N);
+#pragma omp parallel for schedule(dynamic)
+    for (index_type b = 0; b < num_buckets; ++b) {
+      map_type bucket_map{0, hasher{m_coordinate_size},
+                          key_equal{m_coordinate_size}};
+      bucket_map.reserve(bucket_begin[b + 1] - bucket_begin[b]);
+      for (size_type i = bucket_begin[b]; i < bucket_begin[b + 1]; ++i) {
+        index_type const row = bucket_rows[i];
+        auto const result = bucket_map.insert(value_type(
+            key_type(coordinate_begin + row * m_coordinate_size), row));
+        first_row[row] = result.first->second;
+      }
+    }
+
+    // Serial merge of the unique rows.
+    std::vector<int64_t> mapping, inverse_mapping(N);
+    base_type::allocate(N);
+    mapping.reserve(N);
+
+    index_type value{0};
+    for (index_type row = 0; row < N; ++row) {
+      if (first_row[row] == row) {
+        insert(key_type(coordinate_begin + row * m_coordinate_size), value);
+        mapping.push_back(row);
+        inverse_mapping[row] = value++;
+      } else {
+        // the first occurrence precedes the current row
+        inverse_mapping[row] = inverse_mapping[first_row[row]];
+      }
+    }
+
+    return std::make_pair(std::move(mapping), std::move(inverse_mapping));
+  }
+
+  // Smaller inputs do not amortize the thread launch and the extra passes.
+  static constexpr size_type parallel_insert_min_size = 1 << 16;
+
   using base_type::m_coordinate_size;
   map_type m_map;
 };
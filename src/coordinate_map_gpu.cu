@@ -217,7 +217,6 @@ void CoordinateMapGPU<coordinate_type, TemplatedAllocator>::insert(
                  key_first->data(), // first element of the dereferenced iter.
                  sizeof(coordinate_type) * N * m_coordinate_size, // bytes
                  cudaMemcpyDeviceToDevice));
-  CUDA_CHECK(cudaDeviceSynchronize());
   LOG_DEBUG("Reserved and copiedm", N, "x", m_coordinate_size, "coordinates");
 
   // compute cuda kernel call params
@@ -235,7 +234,10 @@ void CoordinateMapGPU<coordinate_type, TemplatedAllocator>::insert(
       m_valid_map_index.data(), //
       m_valid_row_index.data(), //
       num_threads, m_coordinate_size, unused_key);
-  CUDA_CHECK(cudaStreamSynchronize(0));
+  // The copy, the insertion, and the compaction below are all issued on the
+  // default stream and stay on the device. The host only waits for the
+  // number of valid entries returned by thrust::remove_if.
+  CUDA_CHECK(cudaGetLastError());
   LOG_DEBUG("Map size:", m_map->size());
 
   // Valid row index
@@ -76,24 +76,19 @@ struct insert_and_map_functor<coordinate_type, coordinate_field_type,
     auto const &mapping = map_inverse_map.first;
     auto const &inverse_mapping = map_inverse_map.second;
 
-    // return tensors
-    at::Tensor th_mapping = torch::empty(
-        {(int64_t)mapping.size()},
+    // return tensors. Both maps are views of a single allocation.
+    int64_t const num_unique = mapping.size();
+    at::Tensor th_maps = torch::empty(
+        {num_unique + (int64_t)inverse_mapping.size()},
         torch::TensorOptions().requires_grad(false).dtype(torch::kInt64));
-    at::Tensor th_inverse_mapping = torch::empty(
-        {(int64_t)inverse_mapping.size()},
-        torch::TensorOptions().requires_grad(false).dtype(torch::kInt64));
-
-    // copy_n to int to long
-    int64_t *p_mapping = th_mapping.data_ptr<int64_t>();
-    for (default_types::index_type i = 0; i < mapping.size(); ++i) {
-      p_mapping[i] = mapping[i];
-    }
+    int64_t *p_maps = th_maps.data_ptr<int64_t>();
+    std::copy(mapping.begin(), mapping.end(), p_maps);
+    std::copy(inverse_mapping.begin(), inverse_mapping.end(),
+              p_maps + num_unique);
 
-    int64_t *p_inverse_mapping = th_inverse_mapping.data_ptr<int64_t>();
-    for (default_types::index_type i = 0; i < inverse_mapping.size(); ++i) {
-      p_inverse_mapping[i] = inverse_mapping[i];
-    }
+    at::Tensor th_mapping = th_maps.narrow(0, 0, num_unique);
+    at::Tensor th_inverse_mapping =
+        th_maps.narrow(0, num_unique, inverse_mapping.size());
 
     return std::make_pair(std::move(th_mapping), std::move(th_inverse_mapping));
   }
@@ -1347,10 +1342,37 @@ CoordinateMapManager<coordinate_type, coordinate_field_type, TemplatedAllocator,
       torch::empty({(int64_t)nrows, (int64_t)ncols}, options);
 
   LOG_DEBUG("Initialized coordinates");
+  return get_coordinates(p_key, coordinates);
+}
+
+template <typename coordinate_type, typename coordinate_field_type,
+          template <typename C> class TemplatedAllocator,
+          template <typename T, template <typename Q> class A>
+          class CoordinateMapType>
+at::Tensor
+CoordinateMapManager<coordinate_type, coordinate_field_type, TemplatedAllocator,
+                     CoordinateMapType>::get_coordinates(CoordinateMapKey const
+                                                             *p_key,
+                                                         at::Tensor &out)
+    const {
+  auto const it = m_coordinate_maps.find(p_key->get_key());
+  ASSERT(it != m_coordinate_maps.end(), ERROR_MAP_NOT_FOUND);
+  auto const &map = it->second;
+  auto const nrows = map.size();
+  auto const ncols = map.coordinate_size();
+
+  ASSERT(out.dim() == 2 && out.size(0) == (int64_t)nrows &&
+             out.size(1) == (int64_t)ncols,
+         "Invalid output size. Expected:", nrows, "x", ncols);
+  ASSERT(out.scalar_type() == torch::kInt, "Output must be a torch.IntTensor");
+  ASSERT(out.is_contiguous(), "Output must be contiguous");
+  ASSERT(out.is_cuda() == !detail::is_cpu_coordinate_map<CoordinateMapType>::value,
+         "Output device does not match the coordinate map");
+
   // copy to the out coords
-  map.copy_coordinates(coordinates.template data_ptr<coordinate_type>());
+  map.copy_coordinates(out.template data_ptr<coordinate_type>());
   LOG_DEBUG("Copied coordinates");
-  return coordinates;
+  return out;
 }
 
 namespace detail {
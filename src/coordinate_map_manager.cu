@@ -44,6 +44,16 @@ __global__ void cuda_copy_n(src_type const *src, uint32_t N, dst_type *dst) {
   CUDA_KERNEL_LOOP(index, N) { dst[index] = src[index]; }
 }
 
+// Copy the concatenation of src0[:N0] and src1[:N1] to dst.
+template <typename src_type, typename dst_type>
+__global__ void cuda_concat_copy_n(src_type const *src0, uint32_t N0,
+                                   src_type const *src1, uint32_t N1,
+                                   dst_type *dst) {
+  CUDA_KERNEL_LOOP(index, N0 + N1) {
+    dst[index] = index < N0 ? src0[index] : src1[index - N0];
+  }
+}
+
 template <typename coordinate_type, typename coordinate_field_type,
           template <typename C> class TemplatedAllocator>
 struct insert_and_map_functor<coordinate_type, coordinate_field_type,
@@ -76,38 +86,33 @@ struct insert_and_map_functor<coordinate_type, coordinate_field_type,
     auto const &mapping = map_inverse_map.first;
     auto const &inverse_mapping = map_inverse_map.second;
 
-    // return tensors
-    // TODO int64_t
+    // return tensors. Both maps are views of a single allocation filled by a
+    // single kernel.
     LOG_DEBUG("Reserve mapping torch output tensors.");
-    at::Tensor th_mapping = torch::empty(
-        {(int64_t)mapping.size()},
-        th_coordinate.options().requires_grad(false).dtype(torch::kInt64));
-    at::Tensor th_inverse_mapping = torch::empty(
-        {(int64_t)inverse_mapping.size()},
+    uint32_t const num_unique = mapping.size();
+    uint32_t const num_total = num_unique + inverse_mapping.size();
+    at::Tensor th_maps = torch::empty(
+        {(int64_t)num_total},
         th_coordinate.options().requires_grad(false).dtype(torch::kInt64));
 
-    auto const num_blocks =
-        (mapping.size() + CUDA_NUM_THREADS - 1) / CUDA_NUM_THREADS;
-
-    LOG_DEBUG("cuda_copy_n with num_blocks:", num_blocks,
-              "mapping.size():", mapping.size());
-    detail::cuda_copy_n<default_types::index_type, int64_t>
-        <<<num_blocks, CUDA_NUM_THREADS>>>(mapping.cbegin(), mapping.size(),
-                                           th_mapping.data_ptr<int64_t>());
-
-    auto const num_inv_blocks =
-        (inverse_mapping.size() + CUDA_NUM_THREADS - 1) / CUDA_NUM_THREADS;
-
-    LOG_DEBUG("cuda_copy_n with num_inv_blocks:", num_inv_blocks,
-              "inverse_mapping.size():", inverse_mapping.size());
-    if (inverse_mapping.size() > 0) {
-      detail::cuda_copy_n<default_types::index_type, int64_t>
-          <<<num_inv_blocks, CUDA_NUM_THREADS>>>(
-              inverse_mapping.cbegin(), inverse_mapping.size(),
-              th_inverse_mapping.data_ptr<int64_t>());
+    if (num_total > 0) {
+      auto const num_blocks =
+          (num_total + CUDA_NUM_THREADS - 1) / CUDA_NUM_THREADS;
+
+      LOG_DEBUG("cuda_concat_copy_n with num_blocks:", num_blocks,
+                "mapping.size():", mapping.size(),
+                "inverse_mapping.size():", inverse_mapping.size());
+      detail::cuda_concat_copy_n<default_types::index_type, int64_t>
+          <<<num_blocks, CUDA_NUM_THREADS>>>(
+              mapping.cbegin(), num_unique, inverse_mapping.cbegin(),
+              inverse_mapping.size(), th_maps.data_ptr<int64_t>());
       CUDA_CHECK(cudaStreamSynchronize(0));
     }
 
+    at::Tensor th_mapping = th_maps.narrow(0, 0, num_unique);
+    at::Tensor th_inverse_mapping =
+        th_maps.narrow(0, num_unique, inverse_mapping.size());
+
     LOG_DEBUG("End of insert_map_functor");
     // return std::make_pair(std::move(th_mapping),
     // std::move(th_inverse_mapping));
@@ -352,6 +352,10 @@ public:
 
   at::Tensor get_coordinates(CoordinateMapKey const *p_key) const;
 
+  // copy the coordinates to a preallocated tensor and return it
+  at::Tensor get_coordinates(CoordinateMapKey const *p_key,
+                             at::Tensor &out) const;
+
   at::Tensor get_coordinate_field(CoordinateMapKey const *p_key) const;
 
   std::pair<at::Tensor, at::Tensor>
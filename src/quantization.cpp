@@ -152,7 +152,7 @@ std::vector<std::vector<int>> quantize_label(int const *const p_coords,
   using coordinate_type = int32_t;
   using key_type = coordinate<coordinate_type>;
   using mapped_type = std::pair<int, int>; // row index and label
-  using hasher = detail::coordinate_murmur3<coordinate_type>;
+  using hasher = detail::coordinate_packed_hash<coordinate_type>;
   using key_equal = detail::coordinate_equal_to<coordinate_type>;
   using map_type = robin_hood::unordered_flat_map<key_type,    // key
                                                   mapped_type, // mapped_type
@@ -8,6 +8,9 @@ import MinkowskiEngineTest._C as _C
 from utils import load_file, batched_coordinates
 from gradcheck import gradcheck
 
+# torch.inference_mode is available from pytorch 1.9
+inference_mode = getattr(torch, "inference_mode", torch.no_grad)
+
 
 class ConvolutionTestCase(unittest.TestCase):
     def test(self):
@@ -83,6 +86,65 @@ class ConvolutionTestCase(unittest.TestCase):
             manager,
         )
 
+    def test_direct_convolution(self):
+        # Inputs with at most 4 channels take the direct convolution. Zero
+        # padding the channels gives the same convolution on the gemm path.
+        OC, PC = 8, 8
+        kernel_size = [3, 3, 3]
+        kernel_stride = [1, 1, 1]
+        kernel_dilation = [1, 1, 1]
+        prev_num_threads = _C.get_max_threads()
+        # The map of the larger input has more than 65535 rows, which needs
+        # the 32 bit input indices
+        for max_coordinate in [16, 64]:
+            coordinates = torch.cat(
+                (
+                    torch.zeros(200000, 1, dtype=torch.int),
+                    torch.randint(0, max_coordinate, (200000, 3), dtype=torch.int),
+                ),
+                1,
+            )
+            manager = _C.CoordinateMapManager()
+            in_key, unique_inverse_map = manager.insert_and_map(
+                coordinates, [1, 1, 1], ""
+            )
+            N = manager.size(in_key)
+            if max_coordinate == 64:
+                self.assertGreater(N, 65535)
+
+            for IC in [1, 2, 3, 4]:
+                in_features = torch.rand(N, IC)
+                kernel = torch.rand(27, IC, OC)
+                padded_in_features = torch.zeros(N, PC)
+                padded_in_features[:, :IC] = in_features
+                padded_kernel = torch.zeros(27, PC, OC)
+                padded_kernel[:, :IC] = kernel
+
+                args = (
+                    kernel_size,
+                    kernel_stride,
+                    kernel_dilation,
+                    _C.RegionType.HYPER_CUBE,
+                    torch.IntTensor(),
+                    in_key,
+                    in_key,
+                    manager,
+                )
+                try:
+                    for num_threads in [1, 4]:
+                        _C.set_num_threads(num_threads)
+                        out_features = _C.ConvolutionForwardCPU(
+                            in_features, kernel, *args
+                        )
+                        ref_features = _C.ConvolutionForwardCPU(
+                            padded_in_features, padded_kernel, *args
+                        )
+                        self.assertTrue(
+                            torch.allclose(out_features, ref_features, atol=1e-3)
+                        )
+                finally:
+                    _C.set_num_threads(prev_num_threads)
+
     def test_pcd(self):
         IC, OC = 3, 16
         coords, colors, pcd = load_file("1.ply")
@@ -101,32 +163,35 @@ class ConvolutionTestCase(unittest.TestCase):
                 bcoords = batched_coordinates([dcoords for i in range(batch_size)])
 
                 tcolors = torch.from_numpy(colors).float()
-                bcolors = torch.cat([tcolors for i in range(batch_size)])
-
-                for i in range(10):
-                    manager = _C.CoordinateMapManager()
-
-                    # batch insert
-                    in_key, (unique_map, inverse_map) = manager.insert_and_map(
-                        bcoords, [1, 1, 1], ""
-                    )
-                    ucolors = bcolors[unique_map.long()]
-                    out_key = in_key
-
-                    stime = time.time()
-                    out_features = _C.ConvolutionForwardCPU(
-                        ucolors,
-                        kernel,
-                        kernel_size,
-                        kernel_stride,
-                        kernel_dilation,
-                        _C.RegionType.HYPER_CUBE,
-                        torch.IntTensor(),
-                        in_key,
-                        out_key,
-                        manager,
-                    )
-                    min_time = min(time.time() - stime, min_time)
+                bcolors = tcolors.unsqueeze(0).expand(batch_size, -1, -1).reshape(
+                    -1, tcolors.size(1)
+                )
+
+                manager = _C.CoordinateMapManager()
+
+                # batch insert
+                in_key, (unique_map, inverse_map) = manager.insert_and_map(
+                    bcoords, [1, 1, 1], ""
+                )
+                ucolors = bcolors[unique_map.long()]
+                out_key = in_key
+
+                with inference_mode():
+                    for i in range(10):
+                        stime = time.time()
+                        out_features = _C.ConvolutionForwardCPU(
+                            ucolors,
+                            kernel,
+                            kernel_size,
+                            kernel_stride,
+                            kernel_dilation,
+                            _C.RegionType.HYPER_CUBE,
+                            torch.IntTensor(),
+                            in_key,
+                            out_key,
+                            manager,
+                        )
+                        min_time = min(time.time() - stime, min_time)
 
                 print(f"{batch_size}\t{voxel_size}\t{manager.size(in_key)}\t{min_time}")
 
@@ -31,6 +31,7 @@
 #include "types.hpp"
 #include "utils.hpp"
 
+#include <omp.h>
 #include <torch/extension.h>
 
 #include <pybind11/pybind11.h>
@@ -123,4 +124,9 @@ PYBIND11_MODULE(TORCH_EXTENSION_NAME, m) {
         &minkowski::ConvolutionBackwardCPU<
             minkowski::default_types::dcoordinate_type>,
         py::call_guard<py::gil_scoped_release>());
+
+  // The CPU convolution picks its serial or parallel path from the number of
+  // OpenMP threads
+  m.def("get_max_threads", &omp_get_max_threads);
+  m.def("set_num_threads", &omp_set_num_threads);
 }
@@ -27,6 +27,8 @@
 #include "types.hpp"
 #include "utils.hpp"
 
+#include <algorithm>
+
 #include <torch/extension.h>
 
 namespace minkowski {
@@ -89,6 +91,37 @@ coordinate_map_inverse_test(const torch::Tensor &coordinates) {
                         double>(std::move(unique_inverse_map), t.toc());
 }
 
+std::pair<map_inverse_map_type, double>
+coordinate_map_remap_test(const torch::Tensor &coordinates, int num_threads) {
+  torch::TensorArg arg_coordinates(coordinates, "coordinates", 0);
+
+  torch::CheckedFrom c = "coordinate_map_remap_test";
+  torch::checkContiguous(c, arg_coordinates);
+  // must match coordinate_type
+  torch::checkScalarType(c, arg_coordinates, torch::kInt);
+  torch::checkBackend(c, arg_coordinates.tensor, torch::Backend::CPU);
+  torch::checkDim(c, arg_coordinates, 2);
+
+  auto const N = (index_type)coordinates.size(0);
+  auto const D = (index_type)coordinates.size(1);
+  coordinate_type const *ptr = coordinates.data_ptr<coordinate_type>();
+
+  // Large inputs with more than one thread take the parallel insertion
+  int const prev_num_threads = omp_get_max_threads();
+  if (num_threads > 0)
+    omp_set_num_threads(num_threads);
+
+  CoordinateMapCPU<coordinate_type> map{N, D};
+
+  timer t;
+  t.tic();
+  std::pair<std::vector<int64_t>, std::vector<int64_t>> unique_inverse_map =
+      map.insert_and_map<true>(ptr, ptr + N * D);
+  double const elapsed = t.toc();
+  omp_set_num_threads(prev_num_threads);
+  return std::make_pair(std::move(unique_inverse_map), elapsed);
+}
+
 std::pair<std::vector<index_type>, std::vector<index_type>>
 coordinate_map_batch_find_test(const torch::Tensor &coordinates,
                                const torch::Tensor &queries) {
@@ -111,17 +144,18 @@ coordinate_map_batch_find_test(const torch::Tensor &coordinates,
 
   auto const N = (index_type)coordinates.size(0);
   auto const D = (index_type)coordinates.size(1);
-  // auto const NQ = (index_type)queries.size(0);
+  auto const NQ = (index_type)queries.size(0);
   auto const DQ = (index_type)queries.size(1);
 
   ASSERT(D == DQ, "Coordinates and queries must have the same size.");
   coordinate_type const *ptr = coordinates.data_ptr<coordinate_type>();
   coordinate_type const *query_ptr = queries.data_ptr<coordinate_type>();
 
-  CoordinateMapCPU<coordinate_type> map{N, D};
+  // find() can search at most the capacity of the map
+  CoordinateMapCPU<coordinate_type> map{std::max(N, NQ), D};
   map.insert(ptr, ptr + N * D);
 
-  auto query_coordinates = coordinate_range<coordinate_type>(N, D, query_ptr);
+  auto query_coordinates = coordinate_range<coordinate_type>(NQ, D, query_ptr);
   auto query_results =
       map.find(query_coordinates.begin(), query_coordinates.end());
 
@@ -186,6 +220,9 @@ PYBIND11_MODULE(TORCH_EXTENSION_NAME, m) {
   m.def("coordinate_map_inverse_test", &minkowski::coordinate_map_inverse_test,
         "Minkowski Engine coordinate map batch insert test");
 
+  m.def("coordinate_map_remap_test", &minkowski::coordinate_map_remap_test,
+        "Minkowski Engine coordinate map remapping insert test");
+
   m.def("coordinate_map_batch_find_test",
         &minkowski::coordinate_map_batch_find_test,
         "Minkowski Engine coordinate map batch find test");
@@ -25,6 +25,36 @@ class CoordinateMapTestCase(unittest.TestCase):
             torch.all(coordinates == coordinates[mapping][inverse_mapping])
         )
 
+    def test_parallel_remap(self):
+        # More than 2^16 rows with many duplicates
+        N = 200000
+        coordinates = torch.randint(0, 32, (N, 3), dtype=torch.int)
+        for num_threads in [1, 4]:
+            (
+                mapping_inverse_mapping,
+                time,
+            ) = MinkowskiEngineTest._C.coordinate_map_remap_test(
+                coordinates, num_threads
+            )
+            mapping, inverse_mapping = mapping_inverse_mapping
+            mapping = torch.LongTensor(mapping)
+            inverse_mapping = torch.LongTensor(inverse_mapping)
+            self.assertTrue(
+                torch.all(coordinates == coordinates[mapping][inverse_mapping])
+            )
+
+            # The unique rows are the first occurrences in the input order
+            _, first_index, serial_inverse = np.unique(
+                coordinates.numpy(), axis=0, return_index=True, return_inverse=True
+            )
+            order = np.argsort(first_index)
+            rank = np.empty_like(order)
+            rank[order] = np.arange(len(order))
+            self.assertTrue(np.all(mapping.numpy() == first_index[order]))
+            self.assertTrue(
+                np.all(inverse_mapping.numpy() == rank[serial_inverse.reshape(-1)])
+            )
+
     def test_pcd_insert(self):
         coords, colors, pcd = load_file("1.ply")
         BATCH_SIZE = 1
@@ -64,6 +94,24 @@ class CoordinateMapTestCase(unittest.TestCase):
         self.assertEqual(query_value[1], 2)
         self.assertEqual(query_value[2], 2)
 
+    def test_large_find(self):
+        # More queries than coordinates with both hits and misses
+        coordinates = torch.randint(0, 64, (150000, 3), dtype=torch.int)
+        queries = torch.randint(0, 128, (200000, 3), dtype=torch.int)
+        (
+            valid_query_index,
+            query_value,
+        ) = MinkowskiEngineTest._C.coordinate_map_batch_find_test(coordinates, queries)
+        valid_query_index = torch.LongTensor(valid_query_index)
+        query_value = torch.LongTensor(query_value)
+        self.assertEqual(len(valid_query_index), len(query_value))
+        self.assertTrue(0 < len(valid_query_index) < len(queries))
+        # in the query order
+        self.assertTrue(torch.all(valid_query_index[1:] > valid_query_index[:-1]))
+        self.assertTrue(
+            torch.all(coordinates[query_value] == queries[valid_query_index])
+        )
+
     def test_stride(self):
         coordinates = torch.IntTensor([[0, 1], [0, 2], [0, 3], [0, 3]])
         stride = [1]
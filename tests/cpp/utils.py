@@ -85,12 +85,7 @@ def batched_coordinates(coords, dtype=torch.int32, device=None):
         torch.float32,
     ], "Only torch.int32, torch.float32 supported for coordinates."
 
-    # Create a batched coordinates
-    N = np.array([len(cs) for cs in coords]).sum()
-    bcoords = torch.zeros((N, D + 1), dtype=dtype, device=device)  # uninitialized
-
-    s = 0
-    for b, cs in enumerate(coords):
+    def to_tensor(cs):
         if dtype == torch.int32:
             if isinstance(cs, np.ndarray):
                 cs = torch.from_numpy(np.floor(cs))
@@ -98,15 +93,30 @@ def batched_coordinates(coords, dtype=torch.int32, device=None):
                 isinstance(cs, torch.IntTensor) or isinstance(cs, torch.LongTensor)
             ):
                 cs = cs.floor()
-
-            cs = cs.int()
+            return cs.int()
         else:
             if isinstance(cs, np.ndarray):
                 cs = torch.from_numpy(cs)
+            return cs
 
-        cn = len(cs)
-        # BATCH_FIRST:
-        bcoords[s : s + cn, 1:] = cs
-        bcoords[s : s + cn, 0] = b
-        s += cn
-    return bcoords
\ No newline at end of file
+    # Create a batched coordinates
+    B = len(coords)
+    lengths = torch.LongTensor([len(cs) for cs in coords])
+    N = int(lengths.sum())
+    bcoords = torch.empty((N, D + 1), dtype=dtype, device=device)  # uninitialized
+    # BATCH_FIRST:
+    bcoords[:, 0] = torch.arange(B, dtype=dtype, device=device).repeat_interleave(
+        lengths.to(device)
+    )
+
+    if all(cs is coords[0] for cs in coords):
+        # The same coordinates repeated: fill all batches with a single copy
+        cs = to_tensor(coords[0])
+        bcoords[:, 1:].view(B, -1, D).copy_(cs.unsqueeze(0).expand(B, -1, -1))
+    else:
+        s = 0
+        for cs in coords:
+            cn = len(cs)
+            bcoords[s : s + cn, 1:] = to_tensor(cs)
+            s += cn
+    return bcoords
@@ -137,6 +137,107 @@ class CoordinateManagerTestCase(unittest.TestCase):
         )
         # print(manager.stride_map(key, stride_key))
 
+    def test_stride_cache(self):
+        coordinates = torch.IntTensor(
+            [[0, 1], [0, 1], [0, 2], [0, 2], [1, 0], [1, 0], [1, 1]]
+        )
+
+        manager = ME.CoordinateManager(
+            D=1, coordinate_map_type=ME.CoordinateMapType.CPU
+        )
+        key, (unique_map, inverse_map) = manager.insert_and_map(coordinates, [1])
+
+        stride_key = manager.stride(key, [4])
+        self.assertTrue(manager.stride(key, 4) is stride_key)
+
+        manager.clear_cache()
+        self.assertTrue(manager.stride(key, [4]) == stride_key)
+
+    def test_coordinate_map_key_input(self):
+        coordinates = torch.IntTensor([[0, 1], [0, 2], [1, 0]])
+
+        manager = ME.CoordinateManager(
+            D=1, coordinate_map_type=ME.CoordinateMapType.CPU
+        )
+        key, (unique_map, inverse_map) = manager.insert_and_map(coordinates, [1])
+        self.assertTrue(manager._get_coordinate_map_key(torch.IntTensor([1])) == key)
+        with self.assertRaises(AssertionError):
+            manager._get_coordinate_map_key(torch.FloatTensor([1]))
+
+    def test_insert_multilevel(self):
+        coordinates = torch.IntTensor(
+            [[0, 1], [0, 1], [0, 2], [0, 3], [1, 0], [1, 5], [1, 6]]
+        )
+
+        manager = ME.CoordinateManager(
+            D=1, coordinate_map_type=ME.CoordinateMapType.CPU
+        )
+        keys, (unique_map, inverse_map) = manager.insert_multilevel(
+            coordinates, [1, 2, 4]
+        )
+        self.assertEqual(len(keys), 3)
+        self.assertEqual(manager.size(keys[0]), 6)
+        self.assertEqual(manager.size(keys[1]), 5)
+        self.assertEqual(manager.size(keys[2]), 3)
+        self.assertTrue(manager.stride(keys[1], 2) is keys[2])
+        self.assertTrue(
+            torch.all(
+                coordinates[unique_map.long()] == manager.get_coordinates(keys[0])
+            )
+        )
+
+        with self.assertRaises(ValueError):
+            manager.insert_multilevel(coordinates, [2, 3], "odd")
+
+    def test_specialized_manager(self):
+        coordinates = torch.IntTensor([[0, 1, 1, 1], [0, 2, 3, 4], [1, 0, 0, 1]])
+
+        manager = ME.CoordinateManager(
+            D=3, coordinate_map_type=ME.CoordinateMapType.CPU
+        )
+        self.assertTrue(isinstance(manager, ME.CoordinateManager))
+        self.assertEqual(manager.D, 3)
+        key, (unique_map, inverse_map) = manager.insert_and_map(coordinates, 1)
+        self.assertTrue(manager.stride(key, 2) is manager.stride(key, [2, 2, 2]))
+        self.assertTrue(manager._get_coordinate_map_key(1) == key)
+
+    def test_get_coordinates_out(self):
+        coordinates = torch.IntTensor([[0, 1], [0, 1], [0, 2], [1, 0]])
+
+        manager = ME.CoordinateManager(
+            D=1, coordinate_map_type=ME.CoordinateMapType.CPU
+        )
+        key, (unique_map, inverse_map) = manager.insert_and_map(coordinates, [1])
+
+        out = torch.empty(manager.size(key), 2, dtype=torch.int)
+        self.assertTrue(manager.get_coordinates(key, out=out) is out)
+        self.assertTrue(torch.all(out == coordinates[unique_map.long()]))
+        self.assertTrue(torch.all(manager.get_coordinates(key) == out))
+
+        # Without out, every call returns an independent tensor
+        coords0 = manager.get_coordinates(key)
+        coords1 = manager.get_coordinates(key)
+        coords0 -= 1
+        self.assertTrue(torch.all(coords1 == out))
+
+    def test_permute_label(self):
+        coordinates = torch.IntTensor([[0, 0], [0, 1], [0, 2], [0, 3]])
+        label = torch.LongTensor([1, 1, 2, 2])
+
+        manager = ME.CoordinateManager(
+            D=1, coordinate_map_type=ME.CoordinateMapType.CPU
+        )
+        key, (unique_map, inverse_map) = manager.insert_and_map(coordinates, [1])
+        stride_key = manager.stride(key, [2])
+
+        permuted_label = manager.permute_label(label[unique_map.long()], 3, 2, 1)
+        strided_coords = manager.get_coordinates(stride_key)
+        for coordinate, curr_label in zip(strided_coords, permuted_label):
+            self.assertEqual(curr_label.item(), 1 if coordinate[1] == 0 else 2)
+
+        with self.assertRaises(ValueError):
+            manager.permute_label(label[unique_map.long()], 2, 2, 1)
+
     def test_stride_cuda(self):
 
         coordinates = torch.IntTensor(
@@ -180,6 +281,47 @@ class CoordinateManagerTestCase(unittest.TestCase):
             )
         )
 
+    def test_insert_and_map_cuda(self):
+        if not ME.is_cuda_available():
+            return
+
+        coordinates = torch.IntTensor(
+            [[0, 1], [0, 1], [0, 2], [0, 2], [1, 0], [1, 0], [1, 1]]
+        ).cuda()
+
+        manager = ME.CoordinateManager(
+            D=1, coordinate_map_type=ME.CoordinateMapType.CUDA
+        )
+        key, (unique_map, inverse_map) = manager.insert_and_map(coordinates, [1])
+        self.assertEqual(len(unique_map), 4)
+        self.assertTrue(
+            torch.all(coordinates[unique_map.long()][inverse_map.long()] == coordinates)
+        )
+        self.assertTrue(
+            torch.all(manager.get_coordinates(key) == coordinates[unique_map.long()])
+        )
+
+        # CPU coordinates are staged through the pinned buffer
+        cpu_coordinates = coordinates.cpu()
+        for string_id in ["cpu0", "cpu1"]:
+            key, (cpu_unique_map, cpu_inverse_map) = manager.insert_and_map(
+                cpu_coordinates, [1], string_id
+            )
+            self.assertTrue(cpu_unique_map.is_cuda)
+            # The kept row of a duplicate may differ between inserts
+            self.assertTrue(
+                torch.all(
+                    coordinates[cpu_unique_map.long()]
+                    == manager.get_coordinates(key)
+                )
+            )
+            self.assertTrue(
+                torch.all(
+                    coordinates[cpu_unique_map.long()][cpu_inverse_map.long()]
+                    == coordinates
+                )
+            )
+
     def test_negative_coords(self):
         coords = torch.IntTensor(
             [[0, -3], [0, -2], [0, -1], [0, 0], [0, 1], [0, 2], [0, 3]]
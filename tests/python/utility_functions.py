@@ -22,6 +22,7 @@
 # Please cite "4D Spatio-Temporal ConvNets: Minkowski Convolutional Neural
 # Networks", CVPR'19 (https://arxiv.org/abs/1904.08755) if you use any part
 # of the code.
+import numpy as np
 import torch
 import unittest
 
@@ -34,3 +35,30 @@ class TestUtility(unittest.TestCase):
         if ME.is_cuda_available():
             print(ME.cuda_version())
             print(ME.get_gpu_memory_info())
+
+    def test_batched_coordinates_numba(self):
+        try:
+            import numba
+        except ImportError:
+            self.skipTest("numba is not installed")
+
+        coords = [
+            torch.IntTensor([[0, 1], [2, 3], [4, 5]]),
+            np.array([[6, 7]], dtype=np.int32),
+            torch.IntTensor([[8, 9], [10, 11]]),
+        ]
+        self.assertTrue(
+            torch.all(
+                ME.utils.batched_coordinates_numba(coords)
+                == ME.utils.batched_coordinates(coords)
+            )
+        )
+
+        # The same coordinates for every batch
+        shared = [coords[0]] * 4
+        self.assertTrue(
+            torch.all(
+                ME.utils.batched_coordinates_numba(shared)
+                == ME.utils.batched_coordinates(shared)
+            )
+        )